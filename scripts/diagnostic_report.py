@@ -6,13 +6,80 @@ This script analyzes the processed Spotify data and generates a comprehensive
 diagnostic report with statistics and insights.
 """
 
+import heapq
 import json
+import mmap
 import os
+import sys
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
 from pathlib import Path
 
+# Prefer a C-accelerated JSON parser when one is installed; the large
+# streaming-history dumps are dominated by parse time with the stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# pandas lets the analyses run on a columnar (struct-of-arrays) frame with
+# C-level groupby/aggregation instead of per-entry dict lookups; the
+# pure-Python loops remain as a fallback when it is not installed.
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+STREAMING_COLUMNS = ["artistName", "trackName", "albumName", "msPlayed", "endTime"]
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' natively on 3.11+, so no
+    # per-row string rewrite is needed
+    parse_end_time = datetime.fromisoformat
+else:
+    def parse_end_time(date_str):
+        """Parse an endTime string, tolerating the 'Z' UTC suffix"""
+        if date_str.endswith('Z'):
+            date_str = date_str[:-1] + '+00:00'
+        return datetime.fromisoformat(date_str)
+
+def load_json_file(path):
+    """Load a JSON file with the fastest available parser"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            # Memory-map the file so orjson parses straight out of the
+            # page cache instead of a read() copy; an empty file cannot
+            # be mapped, so fall back to read() for that edge case
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return orjson.loads(memoryview(mm))
+            except ValueError:
+                return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        if ujson is not None:
+            return ujson.load(f)
+        return json.load(f)
+
+def write_json_file(path, obj):
+    """Write a JSON file (indented) with the fastest available serializer"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            if ujson is not None:
+                ujson.dump(obj, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(obj, f, indent=2, ensure_ascii=False)
+
 class SpotifyDiagnosticReport:
+    # Fixed attribute set: skip the per-instance __dict__
+    __slots__ = ("data_dir", "report", "merged_data", "streaming_df", "_track_stats", "_dates")
+
     def __init__(self, data_dir="."):
         self.data_dir = Path(data_dir)
         self.report = {
@@ -25,6 +92,9 @@ class SpotifyDiagnosticReport:
             "temporal_analysis": {},
             "privacy_summary": {}
         }
+        self.streaming_df = None
+        self._track_stats = None
+        self._dates = None
 
     def load_data(self):
         """Load the merged and safe data files"""
@@ -33,8 +103,7 @@ class SpotifyDiagnosticReport:
         # Try to load merged data first
         merged_file = self.data_dir / "merged_spotify_data.json"
         if merged_file.exists():
-            with open(merged_file, 'r', encoding='utf-8') as f:
-                self.merged_data = json.load(f)
+            self.merged_data = load_json_file(merged_file)
             print(f"✅ Loaded merged data: {len(self.merged_data['streaming_history'])} records")
         else:
             # Fall back to safe data
@@ -44,16 +113,75 @@ class SpotifyDiagnosticReport:
             self.merged_data = {"streaming_history": [], "playlists": []}
             
             if safe_streaming.exists():
-                with open(safe_streaming, 'r', encoding='utf-8') as f:
-                    self.merged_data["streaming_history"] = json.load(f)
+                self.merged_data["streaming_history"] = load_json_file(safe_streaming)
                 print(f"✅ Loaded safe streaming data: {len(self.merged_data['streaming_history'])} records")
-            
+
             if safe_playlists.exists():
-                with open(safe_playlists, 'r', encoding='utf-8') as f:
-                    playlist_data = json.load(f)
-                    self.merged_data["playlists"] = playlist_data.get("playlists", [])
+                playlist_data = load_json_file(safe_playlists)
+                self.merged_data["playlists"] = playlist_data.get("playlists", [])
                 print(f"✅ Loaded safe playlist data: {len(self.merged_data['playlists'])} playlists")
 
+        # Build a columnar frame once so every analysis can aggregate in C
+        streaming_data = self.merged_data.get("streaming_history", [])
+        if pd is not None and streaming_data:
+            self.streaming_df = pd.DataFrame(streaming_data, columns=STREAMING_COLUMNS)
+            self.streaming_df["msPlayed"] = pd.to_numeric(
+                self.streaming_df["msPlayed"], errors="coerce").fillna(0).astype("int64")
+            # Parse endTime once, vectorized, for the date-range and
+            # temporal analyses (bad timestamps become NaT)
+            self.streaming_df["endTime_parsed"] = pd.to_datetime(
+                self.streaming_df["endTime"], errors="coerce", utc=True)
+
+    def _get_track_stats(self):
+        """Aggregate per-track stream counts and play time.
+
+        Computed once and shared by analyze_streaming_data (unique track
+        count) and analyze_tracks, so the "track - artist" keys are only
+        built a single time.
+        """
+        if self._track_stats is None:
+            if self.streaming_df is not None:
+                df = self.streaming_df
+                valid = (df["trackName"].notna() & (df["trackName"] != "") &
+                         df["artistName"].notna() & (df["artistName"] != ""))
+                keys = df.loc[valid, "trackName"] + " - " + df.loc[valid, "artistName"]
+                grouped = df.loc[valid, "msPlayed"].groupby(keys).agg(["count", "sum"])
+                self._track_stats = (grouped["count"].to_dict(), grouped["sum"].to_dict())
+            else:
+                track_streams = Counter()
+                track_time = Counter()
+
+                for entry in self.merged_data.get("streaming_history", []):
+                    # Fetch each field once per entry; only build the key for
+                    # rows that will actually be counted
+                    track = entry.get("trackName")
+                    artist = entry.get("artistName")
+                    if track and artist:
+                        track_key = f"{track} - {artist}"
+                        track_streams[track_key] += 1
+                        track_time[track_key] += entry.get("msPlayed", 0)
+
+                self._track_stats = (track_streams, track_time)
+        return self._track_stats
+
+    def _get_parsed_dates(self):
+        """Parse every endTime once and cache the result.
+
+        Only used on the pure-Python path; with pandas the pre-parsed
+        endTime_parsed column plays this role.
+        """
+        if self._dates is None:
+            dates = []
+            for entry in self.merged_data.get("streaming_history", []):
+                date_str = entry.get("endTime")
+                if date_str:
+                    try:
+                        dates.append(parse_end_time(date_str))
+                    except ValueError:
+                        continue
+            self._dates = dates
+        return self._dates
+
     def analyze_streaming_data(self):
         """Analyze streaming history data"""
         print("Analyzing streaming data...")
@@ -65,32 +193,56 @@ class SpotifyDiagnosticReport:
         
         # Basic statistics
         total_streams = len(streaming_data)
-        total_time_ms = sum(entry.get("msPlayed", 0) for entry in streaming_data)
+        if self.streaming_df is not None:
+            total_time_ms = int(self.streaming_df["msPlayed"].sum())
+        else:
+            # One pass gathers total play time and the unique artist/album
+            # sets instead of three separate walks over the history
+            total_time_ms = 0
+            artist_set = set()
+            album_set = set()
+            for entry in streaming_data:
+                total_time_ms += entry.get("msPlayed", 0)
+                artist = entry.get("artistName")
+                if artist:
+                    artist_set.add(artist)
+                album = entry.get("albumName")
+                if album:
+                    album_set.add(album)
         total_time_hours = total_time_ms / (1000 * 60 * 60)
         
         # Date range analysis
-        dates = []
-        for entry in streaming_data:
-            try:
-                date_str = entry.get("endTime", "")
-                if date_str:
-                    date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    dates.append(date)
-            except:
-                continue
-        
-        if dates:
-            min_date = min(dates)
-            max_date = max(dates)
-            date_range_days = (max_date - min_date).days
+        if self.streaming_df is not None:
+            parsed = self.streaming_df["endTime_parsed"].dropna()
+            if len(parsed):
+                min_date = parsed.min().to_pydatetime()
+                max_date = parsed.max().to_pydatetime()
+                date_range_days = (max_date - min_date).days
+            else:
+                min_date = max_date = None
+                date_range_days = 0
         else:
-            min_date = max_date = None
-            date_range_days = 0
-        
-        # Unique counts
-        unique_artists = len(set(entry.get("artistName", "") for entry in streaming_data if entry.get("artistName")))
-        unique_tracks = len(set(f"{entry.get('trackName', '')} - {entry.get('artistName', '')}" for entry in streaming_data if entry.get("trackName") and entry.get("artistName")))
-        unique_albums = len(set(entry.get("albumName", "") for entry in streaming_data if entry.get("albumName")))
+            dates = self._get_parsed_dates()
+
+            if dates:
+                min_date = min(dates)
+                max_date = max(dates)
+                date_range_days = (max_date - min_date).days
+            else:
+                min_date = max_date = None
+                date_range_days = 0
+        
+        # Unique counts (track keys come from the shared track aggregation)
+        unique_tracks = len(self._get_track_stats()[0])
+        if self.streaming_df is not None:
+            df = self.streaming_df
+            artists = df["artistName"]
+            albums = df["albumName"]
+            unique_artists = artists[artists.notna() & (artists != "")].nunique()
+            unique_albums = albums[albums.notna() & (albums != "")].nunique()
+        else:
+            unique_artists = len(artist_set)
+            unique_albums = len(album_set)
         
         self.report["streaming_analysis"] = {
             "total_streams": total_streams,
@@ -118,22 +270,35 @@ class SpotifyDiagnosticReport:
             return
         
         # Artist statistics
-        artist_streams = defaultdict(int)
-        artist_time = defaultdict(int)
-        
-        for entry in streaming_data:
-            artist = entry.get("artistName", "")
-            if artist:
-                artist_streams[artist] += 1
-                artist_time[artist] += entry.get("msPlayed", 0)
-        
-        # Top artists by streams
-        top_artists_by_streams = sorted(artist_streams.items(), key=lambda x: x[1], reverse=True)[:20]
-        top_artists_by_time = sorted(artist_time.items(), key=lambda x: x[1], reverse=True)[:20]
-        
-        # Artist diversity
+        if self.streaming_df is not None:
+            df = self.streaming_df
+            valid = df["artistName"].notna() & (df["artistName"] != "")
+            grouped = df[valid].groupby("artistName")["msPlayed"].agg(["count", "sum"])
+            artist_streams = grouped["count"].to_dict()
+            artist_time = grouped["sum"].to_dict()
+        else:
+            artist_streams = Counter()
+            artist_time = Counter()
+
+            for entry in streaming_data:
+                artist = entry.get("artistName")
+                if artist:
+                    artist_streams[artist] += 1
+                    artist_time[artist] += entry.get("msPlayed", 0)
+        
+        # Top artists by streams (heap select: no need to sort every artist)
+        top_artists_by_streams = heapq.nlargest(20, artist_streams.items(), key=lambda x: x[1])
+        top_artists_by_time = heapq.nlargest(20, artist_time.items(), key=lambda x: x[1])
+        
+        # Artist diversity: sort the stream counts once and count how many
+        # artists reach the 90th-percentile stream count
         total_artists = len(artist_streams)
-        top_10_percent = len([a for a in artist_streams.values() if a >= sorted(artist_streams.values(), reverse=True)[int(len(artist_streams) * 0.1)]])
+        if total_artists:
+            sorted_counts = sorted(artist_streams.values(), reverse=True)
+            threshold = sorted_counts[int(total_artists * 0.1)]
+            top_10_percent = sum(1 for count in sorted_counts if count >= threshold)
+        else:
+            top_10_percent = 0
         
         self.report["artist_analysis"] = {
             "total_artists": total_artists,
@@ -159,19 +324,12 @@ class SpotifyDiagnosticReport:
         if not streaming_data:
             return
         
-        # Track statistics
-        track_streams = defaultdict(int)
-        track_time = defaultdict(int)
-        
-        for entry in streaming_data:
-            track_key = f"{entry.get('trackName', '')} - {entry.get('artistName', '')}"
-            if entry.get("trackName") and entry.get("artistName"):
-                track_streams[track_key] += 1
-                track_time[track_key] += entry.get("msPlayed", 0)
+        # Track statistics (shared with analyze_streaming_data)
+        track_streams, track_time = self._get_track_stats()
         
-        # Top tracks
-        top_tracks_by_streams = sorted(track_streams.items(), key=lambda x: x[1], reverse=True)[:20]
-        top_tracks_by_time = sorted(track_time.items(), key=lambda x: x[1], reverse=True)[:20]
+        # Top tracks (heap select: no need to sort every track)
+        top_tracks_by_streams = heapq.nlargest(20, track_streams.items(), key=lambda x: x[1])
+        top_tracks_by_time = heapq.nlargest(20, track_time.items(), key=lambda x: x[1])
         
         # Track diversity
         total_tracks = len(track_streams)
@@ -208,7 +366,7 @@ class SpotifyDiagnosticReport:
         avg_playlist_size = sum(playlist_sizes) / len(playlist_sizes) if playlist_sizes else 0
         
         # Top playlists by followers
-        top_playlists = sorted(playlists, key=lambda x: x.get("numberOfFollowers", 0), reverse=True)[:10]
+        top_playlists = heapq.nlargest(10, playlists, key=lambda x: x.get("numberOfFollowers", 0))
         
         self.report["playlist_analysis"] = {
             "total_playlists": total_playlists,
@@ -235,20 +393,20 @@ class SpotifyDiagnosticReport:
             return
         
         # Hourly patterns
-        hourly_streams = defaultdict(int)
-        daily_streams = defaultdict(int)
-        monthly_streams = defaultdict(int)
-        
-        for entry in streaming_data:
-            try:
-                date_str = entry.get("endTime", "")
-                if date_str:
-                    date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    hourly_streams[date.hour] += 1
-                    daily_streams[date.strftime('%A')] += 1
-                    monthly_streams[date.strftime('%Y-%m')] += 1
-            except:
-                continue
+        if self.streaming_df is not None:
+            parsed = self.streaming_df["endTime_parsed"].dropna()
+            hourly_streams = {int(h): int(c) for h, c in parsed.dt.hour.value_counts().items()}
+            daily_streams = {d: int(c) for d, c in parsed.dt.day_name().value_counts().items()}
+            monthly_streams = {m: int(c) for m, c in parsed.dt.strftime('%Y-%m').value_counts().items()}
+        else:
+            hourly_streams = Counter()
+            daily_streams = Counter()
+            monthly_streams = Counter()
+
+            for date in self._get_parsed_dates():
+                hourly_streams[date.hour] += 1
+                daily_streams[date.strftime('%A')] += 1
+                monthly_streams[date.strftime('%Y-%m')] += 1
         
         # Peak hours
         peak_hour = max(hourly_streams.items(), key=lambda x: x[1]) if hourly_streams else (0, 0)
@@ -257,7 +415,9 @@ class SpotifyDiagnosticReport:
         self.report["temporal_analysis"] = {
             "hourly_patterns": dict(hourly_streams),
             "daily_patterns": dict(daily_streams),
-            "monthly_patterns": dict(monthly_streams),
+            # Emit months chronologically so report consumers don't have
+            # to re-sort the keys
+            "monthly_patterns": {month: monthly_streams[month] for month in sorted(monthly_streams)},
             "peak_listening": {
                 "hour": peak_hour[0],
                 "day": peak_day[0],
@@ -272,9 +432,8 @@ class SpotifyDiagnosticReport:
         
         privacy_report = self.data_dir / "privacy_analysis_report.json"
         if privacy_report.exists():
-            with open(privacy_report, 'r', encoding='utf-8') as f:
-                privacy_data = json.load(f)
-            
+            privacy_data = load_json_file(privacy_report)
+
             self.report["privacy_summary"] = {
                 "files_analyzed": privacy_data.get("files_analyzed", 0),
                 "safe_files": len(privacy_data.get("safe_files", [])),
@@ -284,9 +443,8 @@ class SpotifyDiagnosticReport:
         
         sanitization_report = self.data_dir / "safe_data" / "sanitization_report.json"
         if sanitization_report.exists():
-            with open(sanitization_report, 'r', encoding='utf-8') as f:
-                sanitization_data = json.load(f)
-            
+            sanitization_data = load_json_file(sanitization_report)
+
             self.report["privacy_summary"]["sanitization"] = {
                 "files_processed": sanitization_data.get("sanitization_stats", {}).get("files_processed", 0),
                 "files_sanitized": sanitization_data.get("sanitization_stats", {}).get("files_sanitized", 0),
@@ -317,10 +475,9 @@ class SpotifyDiagnosticReport:
     def save_report(self, output_file="diagnostic_report.json"):
         """Save the diagnostic report"""
         output_path = self.data_dir / output_file
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.report, f, indent=2, ensure_ascii=False)
-        
+
+        write_json_file(output_path, self.report)
+
         print(f"✅ Diagnostic report saved to: {output_path}")
 
     def print_summary(self):
@@ -7,12 +7,136 @@ It handles both regular account data and extended streaming history.
 """
 
 import json
+import multiprocessing
 import os
-import glob
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 
+# Prefer a C-accelerated JSON parser when one is installed; merging is
+# dominated by decoding the large streaming-history dumps.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# ijson lets us stream streaming-history files entry by entry instead of
+# materializing each file as one big list before merging.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+def clean_entry(entry):
+    """Validate a single streaming record; return it (with msPlayed coerced
+    to int) or None if it should be dropped"""
+    if not (entry.get("trackName") and
+            entry.get("artistName") and
+            entry.get("endTime") and
+            entry.get("msPlayed")):
+        return None
+
+    try:
+        ms_played = int(entry["msPlayed"])
+    except (ValueError, TypeError):
+        return None
+
+    if ms_played <= 0:  # Only include actual plays
+        return None
+
+    entry["msPlayed"] = ms_played
+    return entry
+
+def scan_json_files(dir_path, prefix):
+    """List JSON files in dir_path whose names start with prefix.
+
+    Uses os.scandir directly, which avoids glob's pattern matching and the
+    extra stat call per file; results are sorted for deterministic merges.
+    """
+    if not os.path.isdir(dir_path):
+        return []
+    files = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(".json") and entry.is_file():
+                files.append(entry.path)
+    return sorted(files)
+
+def parse_streaming_file(file_path):
+    """Parse and clean one streaming-history file.
+
+    Returns (file_path, cleaned_entries, error) where cleaned_entries is
+    None if the file was skipped or unreadable. Module-level so it can be
+    dispatched to multiprocessing workers.
+    """
+    try:
+        cleaned = []
+        if ijson is not None:
+            # Stream entries one at a time so peak memory stays at
+            # a single record, not a whole file's worth of objects
+            with open(file_path, 'rb') as f:
+                for entry in ijson.items(f, 'item', use_float=True):
+                    entry = clean_entry(entry)
+                    if entry is not None:
+                        cleaned.append(entry)
+        else:
+            data = load_json_file(file_path)
+            if not isinstance(data, list):
+                return file_path, None, "not a list"
+            for entry in data:
+                entry = clean_entry(entry)
+                if entry is not None:
+                    cleaned.append(entry)
+        return file_path, cleaned, None
+    except Exception as e:
+        return file_path, None, str(e)
+
+def load_json_file(path):
+    """Load a JSON file with the fastest available parser"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        if ujson is not None:
+            return ujson.load(f)
+        return json.load(f)
+
+def write_json_file(path, obj, compact=False):
+    """Write a JSON file with the fastest available serializer.
+
+    compact=True drops indentation and separator whitespace, which
+    shrinks the output and skips the pretty-printing pass entirely.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option))
+    else:
+        indent = None if compact else 2
+        separators = (',', ':') if compact else None
+        with open(path, 'w', encoding='utf-8') as f:
+            if ujson is not None:
+                ujson.dump(obj, f, indent=indent or 0, ensure_ascii=False)
+            else:
+                json.dump(obj, f, indent=indent, separators=separators, ensure_ascii=False)
+
+# Non-sensitive fields to keep from each user-data file
+USER_DATA_FIELDS = {
+    "Identity.json": ("country", "birthdate", "gender"),
+    "Userdata.json": ("username", "email", "created"),
+}
+
 class SpotifyDataMerger:
+    # Fixed attribute set: skip the per-instance __dict__
+    __slots__ = ("data_dir", "merged_data")
+
     def __init__(self, data_dir="."):
         self.data_dir = Path(data_dir)
         self.merged_data = {
@@ -31,41 +155,61 @@ class SpotifyDataMerger:
         print("Merging streaming history files...")
         
         # Regular streaming history files
-        regular_files = glob.glob(str(self.data_dir / "Spotify Account Data" / "StreamingHistory_music_*.json"))
-        
+        regular_files = scan_json_files(
+            self.data_dir / "Spotify Account Data", "StreamingHistory_music_")
+
         # Extended streaming history files
-        extended_files = glob.glob(str(self.data_dir / "Spotify Extended Streaming History" / "Streaming_History_Audio_*.json"))
-        
+        extended_files = scan_json_files(
+            self.data_dir / "Spotify Extended Streaming History", "Streaming_History_Audio_")
+
         all_files = regular_files + extended_files
         
-        for file_path in all_files:
-            try:
-                print(f"Processing: {file_path}")
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                if isinstance(data, list):
-                    self.merged_data["streaming_history"].extend(data)
-                    self.merged_data["metadata"]["files_processed"] += 1
-                    print(f"  Added {len(data)} streaming records")
-                else:
-                    print(f"  Skipped (not a list): {file_path}")
-                    
-            except Exception as e:
-                print(f"  Error processing {file_path}: {e}")
+        parts = []
+        if len(all_files) > 1:
+            # Parsing is CPU-bound, so fan the files out across worker
+            # processes and merge the cleaned results in order
+            workers = min(len(all_files), os.cpu_count() or 1)
+            with multiprocessing.Pool(processes=workers) as pool:
+                for result in pool.imap(parse_streaming_file, all_files):
+                    cleaned = self._merge_parsed_file(*result)
+                    if cleaned:
+                        parts.append(cleaned)
+        else:
+            for file_path in all_files:
+                cleaned = self._merge_parsed_file(*parse_streaming_file(file_path))
+                if cleaned:
+                    parts.append(cleaned)
+
+        # Concatenate all files in one pass: list() over a chain sizes the
+        # merged history up front instead of regrowing it per file
+        if parts:
+            self.merged_data["streaming_history"] = list(chain.from_iterable(parts))
+
+    def _merge_parsed_file(self, file_path, cleaned, error):
+        """Report one parsed streaming-history file and return its entries"""
+        print(f"Processing: {file_path}")
+        if error == "not a list":
+            print(f"  Skipped (not a list): {file_path}")
+            return None
+        if error is not None:
+            print(f"  Error processing {file_path}: {error}")
+            return None
+
+        self.merged_data["metadata"]["files_processed"] += 1
+        print(f"  Added {len(cleaned)} streaming records")
+        return cleaned
 
     def merge_playlists(self):
         """Merge all playlist files"""
         print("Merging playlist files...")
         
-        playlist_files = glob.glob(str(self.data_dir / "Spotify Account Data" / "Playlist*.json"))
+        playlist_files = scan_json_files(self.data_dir / "Spotify Account Data", "Playlist")
         
         for file_path in playlist_files:
             try:
                 print(f"Processing: {file_path}")
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
+                data = load_json_file(file_path)
+
                 if isinstance(data, dict) and "playlists" in data:
                     self.merged_data["playlists"].extend(data["playlists"])
                     self.merged_data["metadata"]["files_processed"] += 1
@@ -91,29 +235,17 @@ class SpotifyDataMerger:
             if file_path.exists():
                 try:
                     print(f"Processing: {file_path}")
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
+                    data = load_json_file(file_path)
+
                     # Only store non-sensitive user data
-                    if filename == "Identity.json":
-                        safe_data = {
-                            "country": data.get("country"),
-                            "birthdate": data.get("birthdate"),
-                            "gender": data.get("gender")
-                        }
-                    elif filename == "Userdata.json":
+                    if filename == "YourLibrary.json":
                         safe_data = {
-                            "username": data.get("username"),
-                            "email": data.get("email"),
-                            "created": data.get("created")
+                            f"{key}_count": len(data.get(key, []))
+                            for key in ("tracks", "albums", "artists")
                         }
-                    elif filename == "YourLibrary.json":
-                        safe_data = {
-                            "tracks_count": len(data.get("tracks", [])),
-                            "albums_count": len(data.get("albums", [])),
-                            "artists_count": len(data.get("artists", []))
-                        }
-                    
+                    else:
+                        safe_data = {key: data.get(key) for key in USER_DATA_FIELDS[filename]}
+
                     self.merged_data["user_data"][filename.replace(".json", "")] = safe_data
                     self.merged_data["metadata"]["files_processed"] += 1
                     print(f"  Added user data from {filename}")
@@ -121,43 +253,20 @@ class SpotifyDataMerger:
                 except Exception as e:
                     print(f"  Error processing {file_path}: {e}")
 
-    def clean_streaming_data(self):
-        """Clean and validate streaming history data"""
-        print("Cleaning streaming history data...")
-        
-        original_count = len(self.merged_data["streaming_history"])
-        
-        # Remove entries with missing required fields
-        cleaned_data = []
-        for entry in self.merged_data["streaming_history"]:
-            if (entry.get("trackName") and 
-                entry.get("artistName") and 
-                entry.get("endTime") and 
-                entry.get("msPlayed")):
-                
-                # Ensure msPlayed is a number
-                try:
-                    entry["msPlayed"] = int(entry["msPlayed"])
-                    if entry["msPlayed"] > 0:  # Only include actual plays
-                        cleaned_data.append(entry)
-                except (ValueError, TypeError):
-                    continue
-        
-        self.merged_data["streaming_history"] = cleaned_data
-        self.merged_data["metadata"]["total_streams"] = len(cleaned_data)
-        
-        print(f"  Cleaned {original_count - len(cleaned_data)} invalid entries")
-        print(f"  Final count: {len(cleaned_data)} streaming records")
-
     def save_merged_data(self, output_file="merged_spotify_data.json"):
         """Save the merged data to a JSON file"""
         output_path = self.data_dir / output_file
+
+        # Entries are validated by clean_entry as they are merged, so the
+        # final count is just the merged length
+        self.merged_data["metadata"]["total_streams"] = len(self.merged_data["streaming_history"])
         
         print(f"Saving merged data to: {output_path}")
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.merged_data, f, indent=2, ensure_ascii=False)
-        
+
+        # The merged dump is machine-read only, so write it compact: the
+        # indentation roughly doubled the file size and serialize time
+        write_json_file(output_path, self.merged_data, compact=True)
+
         print(f"Successfully saved merged data!")
         print(f"Total files processed: {self.merged_data['metadata']['files_processed']}")
         print(f"Total streaming records: {self.merged_data['metadata']['total_streams']}")
@@ -176,10 +285,7 @@ class SpotifyDataMerger:
         
         self.merge_user_data()
         print()
-        
-        self.clean_streaming_data()
-        print()
-        
+
         self.save_merged_data()
         print()
         print("Merge process completed successfully!")
@@ -6,22 +6,45 @@ This script provides a quick overview of the processed Spotify data.
 """
 
 import json
+from collections import Counter
 from pathlib import Path
 
+# Prefer orjson's C parser for the potentially huge merged file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numpy reduces the msPlayed column over packed 8-byte ints instead of a
+# Python loop over boxed integers
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def load_json(path):
+    """Load a JSON file with the fastest available parser"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+MERGED_FILE = Path("merged_spotify_data.json")
+
 def load_merged_data():
-    """Load the merged data file"""
-    merged_file = Path("merged_spotify_data.json")
-    if merged_file.exists():
-        with open(merged_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return None
+    """Load the merged data file; returns (data, size in bytes)"""
+    if MERGED_FILE.exists():
+        # Stat once here so the summary footer doesn't hit the
+        # filesystem again for the same file
+        return load_json(MERGED_FILE), MERGED_FILE.stat().st_size
+    return None, 0
 
 def print_summary():
     """Print a quick summary of the data"""
     print("🎵 SPOTIFY DATA QUICK SUMMARY")
     print("=" * 60)
     
-    data = load_merged_data()
+    data, merged_size = load_merged_data()
     if not data:
         print("❌ No merged data found. Run the merge script first.")
         return
@@ -29,24 +52,41 @@ def print_summary():
     streaming_history = data.get("streaming_history", [])
     playlists = data.get("playlists", [])
     
-    # Basic stats
+    # Basic stats, unique counts and artist tallies in a single pass over
+    # the history (track keys are tuples: no per-entry string building)
     total_streams = len(streaming_history)
-    total_time_ms = sum(entry.get("msPlayed", 0) for entry in streaming_history)
+    total_time_ms = 0
+    artist_streams = Counter()
+    track_keys = set()
+
+    if np is not None:
+        # Vectorized reduction: the msPlayed sum runs in C over an int64
+        # array, so the Python loop only handles the string fields
+        total_time_ms = int(np.fromiter(
+            (entry.get("msPlayed", 0) for entry in streaming_history),
+            dtype=np.int64, count=total_streams).sum())
+        for entry in streaming_history:
+            artist = entry.get("artistName")
+            if artist:
+                artist_streams[artist] += 1
+                track = entry.get("trackName")
+                if track:
+                    track_keys.add((track, artist))
+    else:
+        for entry in streaming_history:
+            total_time_ms += entry.get("msPlayed", 0)
+            artist = entry.get("artistName")
+            if artist:
+                artist_streams[artist] += 1
+                track = entry.get("trackName")
+                if track:
+                    track_keys.add((track, artist))
+
     total_time_hours = total_time_ms / (1000 * 60 * 60)
     total_time_days = total_time_hours / 24
-    
-    # Unique counts
-    unique_artists = len(set(entry.get("artistName", "") for entry in streaming_history if entry.get("artistName")))
-    unique_tracks = len(set(f"{entry.get('trackName', '')} - {entry.get('artistName', '')}" for entry in streaming_history if entry.get("trackName") and entry.get("artistName")))
-    
-    # Top artists
-    artist_streams = {}
-    for entry in streaming_history:
-        artist = entry.get("artistName", "")
-        if artist:
-            artist_streams[artist] = artist_streams.get(artist, 0) + 1
-    
-    top_artists = sorted(artist_streams.items(), key=lambda x: x[1], reverse=True)[:5]
+    unique_artists = len(artist_streams)
+    unique_tracks = len(track_keys)
+    top_artists = artist_streams.most_common(5)
     
     # Playlist stats
     total_playlists = len(playlists)
@@ -70,9 +110,8 @@ def print_summary():
     privacy_file = Path("privacy_analysis_report.json")
     if privacy_file.exists():
         try:
-            with open(privacy_file, 'r', encoding='utf-8') as f:
-                privacy_data = json.load(f)
-            
+            privacy_data = load_json(privacy_file)
+
             files_analyzed = privacy_data.get("files_analyzed", 0)
             safe_files = len(privacy_data.get("safe_files", []))
             risky_files = len(privacy_data.get("risky_files", []))
@@ -87,7 +126,7 @@ def print_summary():
     
     # Data files
     print(f"\n📁 DATA FILES:")
-    print(f"   ✅ Merged Data: merged_spotify_data.json ({Path('merged_spotify_data.json').stat().st_size / (1024*1024):.1f} MB)")
+    print(f"   ✅ Merged Data: {MERGED_FILE} ({merged_size / (1 << 20):.1f} MB)")
     print(f"   ✅ Safe Data: safe_data/ directory")
     print(f"   ✅ Privacy Report: privacy_analysis_report.json")
     
@@ -7,13 +7,191 @@ before publishing to GitHub. It creates clean versions of the data files.
 """
 
 import json
+import mmap
 import os
-import glob
 import re
-import hashlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from copy import deepcopy
+
+# Sanitizing decodes and re-encodes every export, so use a C-accelerated
+# JSON codec when one is installed and fall back to the stdlib otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# ijson streams records one at a time, so the fields being dropped from
+# the safe exports are never materialized as Python objects.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# pyahocorasick matches all removal needles in one automaton pass per
+# key, independent of needle count; the escaped alternation below is the
+# stdlib fallback.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Fields to completely remove wherever they appear
+REMOVE_FIELDS = [
+    'ip_addr', 'ipAddress', 'ip_address', 'ipAddrDecrypted',
+    'email', 'emailAddress', 'email_address',
+    'phone', 'phoneNumber', 'phone_number',
+    'deviceId', 'device_id', 'deviceIdDecrypted',
+    'macAddress', 'mac_address',
+    'creditCard', 'credit_card', 'cardNumber',
+    'password', 'token', 'accessToken', 'refreshToken',
+    'sessionId', 'session_id',
+    'userId', 'user_id', 'username',
+    'address', 'street', 'city', 'zip', 'postalCode',
+    'ssn', 'socialSecurity', 'passport',
+    'location', 'latitude', 'longitude', 'gps',
+    'timezone', 'timeZone',
+    'platform', 'os', 'operatingSystem',
+    'browser', 'userAgent',
+    'connection', 'network', 'wifi',
+    'bluetooth', 'bluetoothAddress'
+]
+
+# Key screening precomputed once: exact membership is a single set
+# probe, and the escaped alternation covers the substring cases in one
+# linear scan per key instead of 30 `in` searches. Longest needles first
+# so the most specific name wins.
+_REMOVE_EXACT = frozenset(field.lower() for field in REMOVE_FIELDS)
+_REMOVE_NEEDLE_RE = re.compile(
+    "|".join(re.escape(needle)
+             for needle in sorted(_REMOVE_EXACT, key=len, reverse=True)))
+
+if ahocorasick is not None:
+    _REMOVE_AUTOMATON = ahocorasick.Automaton()
+    for _needle in _REMOVE_EXACT:
+        _REMOVE_AUTOMATON.add_word(_needle, _needle)
+    _REMOVE_AUTOMATON.make_automaton()
+else:
+    _REMOVE_AUTOMATON = None
+
+def scan_json_files(dir_path, prefix=""):
+    """List JSON files in dir_path, optionally filtered by name prefix.
+
+    os.scandir avoids glob's pattern matching and reuses the cached
+    file-type info per directory entry; results are sorted so runs are
+    deterministic.
+    """
+    if not os.path.isdir(dir_path):
+        return []
+    files = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(".json") and entry.is_file():
+                files.append(Path(entry.path))
+    files.sort()
+    return files
+
+@lru_cache(maxsize=4096)
+def should_drop_key(key):
+    """True if a dict key names a field that must be removed.
+
+    Spotify exports repeat the same few dozen keys across millions of
+    records, so after first sight each key resolves from the cache.
+    """
+    key_lower = key.lower()
+    if _REMOVE_AUTOMATON is not None:
+        return next(_REMOVE_AUTOMATON.iter(key_lower), None) is not None
+    return (key_lower in _REMOVE_EXACT or
+            _REMOVE_NEEDLE_RE.search(key_lower) is not None)
+
+def safe_streaming_entry(entry):
+    """Project one streaming record onto its essential, non-sensitive
+    fields; returns None for incomplete entries.
+
+    Straight-line code specialized to the known export schema: the
+    required fields are validated before the result dict is allocated,
+    so invalid entries cost four lookups and no allocation.
+    """
+    track_name = entry.get("trackName")
+    artist_name = entry.get("artistName")
+    end_time = entry.get("endTime")
+    ms_played = entry.get("msPlayed")
+
+    if not (track_name and artist_name and end_time and ms_played):
+        return None
+
+    return {
+        "trackName": track_name,
+        "artistName": artist_name,
+        "albumName": entry.get("albumName", ""),
+        "endTime": end_time,
+        "msPlayed": ms_played
+    }
+
+def safe_playlist(playlist):
+    """Project one playlist onto its essential, non-sensitive fields"""
+    safe = {
+        "name": playlist.get("name", ""),
+        "description": playlist.get("description", ""),
+        "numberOfFollowers": playlist.get("numberOfFollowers", 0),
+        "items": []
+    }
+
+    for item in playlist.get("items", ()):
+        track = item.get("track") or {}
+        safe["items"].append({
+            "trackName": track.get("trackName", ""),
+            "artistName": track.get("artistName", ""),
+            "albumName": track.get("albumName", ""),
+            "addedAt": item.get("addedAt", "")
+        })
+
+    return safe
+
+def load_json_file(path):
+    """Read a JSON file with the fastest parser available"""
+    if orjson is not None:
+        # Map the file and hand the parser a zero-copy view, so the
+        # bytes go straight from page cache into the parse
+        with open(path, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return orjson.loads(memoryview(mm))
+            except ValueError:
+                # Empty files cannot be mapped
+                return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        if ujson is not None:
+            return ujson.load(f)
+        return json.load(f)
+
+def write_json_file(path, obj, compact=False):
+    """Write a JSON file with the fastest serializer available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option))
+    else:
+        indent = None if compact else 2
+        separators = (',', ':') if compact else None
+        if ujson is not None:
+            payload = ujson.dumps(obj, indent=indent or 0, ensure_ascii=False)
+        else:
+            payload = json.dumps(obj, indent=indent, separators=separators, ensure_ascii=False)
+        # Serialize to one payload and emit it in a single buffered
+        # binary write: json.dump would trickle many small chunks
+        # through the text-layer encoder instead
+        with open(path, 'wb', buffering=1 << 20) as f:
+            f.write(payload.encode('utf-8'))
 
 class SpotifyDataSanitizer:
     def __init__(self, data_dir=".", output_dir="sanitized_data"):
@@ -25,83 +203,121 @@ class SpotifyDataSanitizer:
             "total_redactions": 0,
             "timestamp": datetime.now().isoformat()
         }
+
+        # Running redaction count as a plain attribute: the stats-dict
+        # subscript per sanitized string was measurable on big files.
+        # Folded into sanitization_stats per file by _merge_result.
+        self._redactions = 0
         
         # Create output directory
         self.output_dir.mkdir(exist_ok=True)
         
-        # Patterns to redact or anonymize
+        # Patterns to redact or anonymize, compiled once here: they run
+        # against every string value in the tree, so per-call re-cache
+        # lookups are measurable
         self.redaction_patterns = {
-            'ip_addresses': (r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b', '[IP_ADDRESS]'),
-            'email_addresses': (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL]'),
-            'device_ids': (r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', '[DEVICE_ID]'),
-            'mac_addresses': (r'\b([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})\b', '[MAC_ADDRESS]'),
-            'phone_numbers': (r'\b\+?[1-9]\d{1,14}\b', '[PHONE]'),
-            'credit_cards': (r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b', '[CREDIT_CARD]'),
-            'spotify_uris': (r'spotify:(track|album|artist|playlist|user):[a-zA-Z0-9]+', '[SPOTIFY_URI]')
+            'ip_addresses': (re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'), '[IP_ADDRESS]'),
+            'email_addresses': (re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'), '[EMAIL]'),
+            'device_ids': (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b'), '[DEVICE_ID]'),
+            'mac_addresses': (re.compile(r'\b(?:[0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}\b'), '[MAC_ADDRESS]'),
+            'phone_numbers': (re.compile(r'\b\+?[1-9]\d{1,14}\b'), '[PHONE]'),
+            'credit_cards': (re.compile(r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b'), '[CREDIT_CARD]'),
+            'spotify_uris': (re.compile(r'spotify:(?:track|album|artist|playlist|user):[a-zA-Z0-9]+'), '[SPOTIFY_URI]')
         }
-        
+
+        # One alternation scans each string a single time instead of one
+        # full pass per pattern; the name of the group that matched picks
+        # the replacement. Inner groups above are non-capturing so they
+        # don't collide with the named wrappers.
+        self._union_re = re.compile(
+            "|".join(f"(?P<{name}>{pattern.pattern})"
+                     for name, (pattern, _) in self.redaction_patterns.items()))
+        self._replacements = {name: replacement
+                              for name, (_, replacement) in self.redaction_patterns.items()}
+
         # Fields to completely remove
-        self.remove_fields = [
-            'ip_addr', 'ipAddress', 'ip_address', 'ipAddrDecrypted',
-            'email', 'emailAddress', 'email_address',
-            'phone', 'phoneNumber', 'phone_number',
-            'deviceId', 'device_id', 'deviceIdDecrypted',
-            'macAddress', 'mac_address',
-            'creditCard', 'credit_card', 'cardNumber',
-            'password', 'token', 'accessToken', 'refreshToken',
-            'sessionId', 'session_id',
-            'userId', 'user_id', 'username',
-            'address', 'street', 'city', 'zip', 'postalCode',
-            'ssn', 'socialSecurity', 'passport',
-            'location', 'latitude', 'longitude', 'gps',
-            'timezone', 'timeZone',
-            'platform', 'os', 'operatingSystem',
-            'browser', 'userAgent',
-            'connection', 'network', 'wifi',
-            'bluetooth', 'bluetoothAddress'
-        ]
+        self.remove_fields = REMOVE_FIELDS
 
     def sanitize_string(self, text):
         """Sanitize a string by redacting sensitive patterns"""
         if not isinstance(text, str):
             return text
         
-        sanitized = text
-        redactions = 0
-        
-        for pattern_name, (pattern, replacement) in self.redaction_patterns.items():
-            matches = re.findall(pattern, sanitized)
-            if matches:
-                sanitized = re.sub(pattern, replacement, sanitized)
-                redactions += len(matches)
-        
+        # Cheap containment probes before any regex work: every redaction
+        # pattern needs a digit, an '@' or the "spotify:" literal, none of
+        # which plain track/artist/album names contain
+        if ('@' not in text and 'spotify:' not in text
+                and not any(ch.isdigit() for ch in text)):
+            return text
+
+        # subn substitutes and counts in a single scan over the text
+        sanitized, redactions = self._union_re.subn(self._replace_match, text)
+
         if redactions > 0:
-            self.sanitization_stats["total_redactions"] += redactions
-        
+            self._redactions += redactions
+
         return sanitized
 
+    def _replace_match(self, match):
+        """Map a union-regex match to its pattern's replacement token"""
+        return self._replacements[match.lastgroup]
+
     def sanitize_object(self, obj):
-        """Recursively sanitize an object (dict, list, or primitive)"""
-        if isinstance(obj, dict):
-            sanitized = {}
-            for key, value in obj.items():
-                # Skip fields that should be removed
-                if any(remove_field.lower() in key.lower() for remove_field in self.remove_fields):
-                    continue
-                
-                # Sanitize the value
-                sanitized[key] = self.sanitize_object(value)
-            return sanitized
-        
-        elif isinstance(obj, list):
-            return [self.sanitize_object(item) for item in obj]
-        
-        elif isinstance(obj, str):
+        """Sanitize an object (dict, list, or primitive) in place.
+
+        Walks the tree with an explicit work-list instead of recursion,
+        so deep payloads cost no Python frame per node and cannot hit the
+        recursion limit; containers are mutated rather than rebuilt.
+        Returns obj.
+        """
+        root_type = type(obj)
+        if root_type is str:
             return self.sanitize_string(obj)
-        
-        else:
+        if root_type is not dict and root_type is not list:
             return obj
 
+        # Bind the per-node callables once: the loop body runs millions
+        # of times and each self.X would cost an attribute lookup
+        sanitize_string = self.sanitize_string
+        drop_key = should_drop_key
+        intern = sys.intern
+
+        stack = [obj]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            node = pop()
+
+            if type(node) is dict:
+                # Drop removed fields first, then rewrite the survivors
+                removed = [key for key in node if drop_key(key)]
+                for key in removed:
+                    del node[key]
+
+                # Exact-type dispatch: numbers, bools and nulls can never
+                # match a redaction pattern, so they are never visited,
+                # and empty containers are not worth a stack round trip
+                for key, value in node.items():
+                    value_type = type(value)
+                    if value_type is str:
+                        # Track/artist/album names repeat across
+                        # millions of records: interning the short ones
+                        # collapses the duplicates to one object each
+                        value = sanitize_string(value)
+                        node[key] = intern(value) if len(value) < 64 else value
+                    elif (value_type is dict or value_type is list) and value:
+                        push(value)
+            else:
+                for i, value in enumerate(node):
+                    value_type = type(value)
+                    if value_type is str:
+                        value = sanitize_string(value)
+                        node[i] = intern(value) if len(value) < 64 else value
+                    elif (value_type is dict or value_type is list) and value:
+                        push(value)
+
+        return obj
+
     def should_skip_file(self, file_path):
         """Determine if a file should be skipped entirely"""
         file_name = file_path.name.lower()
@@ -125,34 +341,52 @@ class SpotifyDataSanitizer:
         
         return False
 
-    def sanitize_file(self, file_path):
-        """Sanitize a single file"""
-        print(f"Processing: {file_path}")
-        
+    def _sanitize_one(self, file_path):
+        """Sanitize and save one file without touching shared stats.
+
+        Self-contained so it can run in a worker process. Returns
+        (file_path, skipped, redactions, error).
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            self.sanitization_stats["files_processed"] += 1
-            
+            data = load_json_file(file_path)
+
             # Check if file should be skipped
             if self.should_skip_file(file_path):
-                print(f"  Skipping (contains sensitive data): {file_path}")
-                return None
-            
-            # Create sanitized version
+                return file_path, True, 0, None
+
+            # Create sanitized version; the redaction count is taken as a
+            # delta so it is correct in worker processes too
+            before = self._redactions
             sanitized_data = self.sanitize_object(data)
-            
-            # Check if any redactions were made
-            if self.sanitization_stats["total_redactions"] > 0:
-                self.sanitization_stats["files_sanitized"] += 1
-                print(f"  Sanitized with {self.sanitization_stats['total_redactions']} redactions")
-            
-            return sanitized_data
-            
+            redactions = self._redactions - before
+
+            self.save_sanitized_file(file_path, sanitized_data)
+            return file_path, False, redactions, None
+
         except Exception as e:
-            print(f"  Error processing {file_path}: {e}")
-            return None
+            return file_path, False, 0, str(e)
+
+    def _merge_result(self, file_path, skipped, redactions, error):
+        """Fold one file's outcome into the shared sanitization stats"""
+        print(f"Processing: {file_path}")
+        if error is not None:
+            print(f"  Error processing {file_path}: {error}")
+            return
+
+        self.sanitization_stats["files_processed"] += 1
+
+        if skipped:
+            print(f"  Skipping (contains sensitive data): {file_path}")
+            return
+
+        self.sanitization_stats["total_redactions"] += redactions
+
+        # Count the file as sanitized only if it had redactions of its
+        # own; the old check against the cumulative total flagged every
+        # file after the first hit
+        if redactions > 0:
+            self.sanitization_stats["files_sanitized"] += 1
+            print(f"  Sanitized with {redactions} redactions")
 
     def save_sanitized_file(self, original_path, sanitized_data):
         """Save sanitized data to output directory"""
@@ -166,10 +400,10 @@ class SpotifyDataSanitizer:
         # Create parent directories if they don't exist
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save sanitized data
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(sanitized_data, f, indent=2, ensure_ascii=False)
-        
+        # Save sanitized data compact: it is machine-consumed, and the
+        # indentation roughly doubled output size and serialize time
+        write_json_file(output_path, sanitized_data, compact=True)
+
         print(f"  Saved sanitized version to: {output_path}")
 
     def create_safe_streaming_history(self):
@@ -179,41 +413,35 @@ class SpotifyDataSanitizer:
         safe_streaming_data = []
         
         # Process all streaming history files
-        streaming_files = []
-        streaming_files.extend(glob.glob(str(self.data_dir / "Spotify Account Data" / "StreamingHistory_music_*.json")))
-        streaming_files.extend(glob.glob(str(self.data_dir / "Spotify Extended Streaming History" / "Streaming_History_Audio_*.json")))
+        streaming_files = (
+            scan_json_files(self.data_dir / "Spotify Account Data", "StreamingHistory_music_") +
+            scan_json_files(self.data_dir / "Spotify Extended Streaming History", "Streaming_History_Audio_"))
         
         for file_path in streaming_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                if isinstance(data, list):
-                    for entry in data:
-                        # Only include essential, non-sensitive fields
-                        safe_entry = {
-                            "trackName": entry.get("trackName", ""),
-                            "artistName": entry.get("artistName", ""),
-                            "albumName": entry.get("albumName", ""),
-                            "endTime": entry.get("endTime", ""),
-                            "msPlayed": entry.get("msPlayed", 0)
-                        }
-                        
-                        # Validate entry
-                        if (safe_entry["trackName"] and 
-                            safe_entry["artistName"] and 
-                            safe_entry["endTime"] and 
-                            safe_entry["msPlayed"]):
-                            safe_streaming_data.append(safe_entry)
-                
+                # One extend per file over a filtered map keeps the
+                # projection loop in C and grows the result list once
+                # per file instead of once per record
+                if ijson is not None:
+                    # Stream one entry at a time: peak memory stays at a
+                    # single record instead of a whole file's tree
+                    with open(file_path, 'rb') as f:
+                        safe_streaming_data.extend(filter(None, map(
+                            safe_streaming_entry,
+                            ijson.items(f, 'item', use_float=True))))
+                else:
+                    data = load_json_file(file_path)
+                    if isinstance(data, list):
+                        safe_streaming_data.extend(
+                            filter(None, map(safe_streaming_entry, data)))
+
             except Exception as e:
                 print(f"  Error processing streaming file {file_path}: {e}")
         
         # Save safe streaming history
         output_path = self.output_dir / "safe_streaming_history.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(safe_streaming_data, f, indent=2, ensure_ascii=False)
-        
+        write_json_file(output_path, safe_streaming_data, compact=True)
+
         print(f"  Saved {len(safe_streaming_data)} safe streaming records to: {output_path}")
 
     def create_safe_playlists(self):
@@ -222,44 +450,29 @@ class SpotifyDataSanitizer:
         
         safe_playlists = []
         
-        playlist_files = glob.glob(str(self.data_dir / "Spotify Account Data" / "Playlist*.json"))
+        playlist_files = scan_json_files(self.data_dir / "Spotify Account Data", "Playlist")
         
         for file_path in playlist_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                if isinstance(data, dict) and "playlists" in data:
-                    for playlist in data["playlists"]:
-                        # Only include essential, non-sensitive fields
-                        safe_playlist = {
-                            "name": playlist.get("name", ""),
-                            "description": playlist.get("description", ""),
-                            "numberOfFollowers": playlist.get("numberOfFollowers", 0),
-                            "items": []
-                        }
-                        
-                        # Process playlist items
-                        if "items" in playlist:
-                            for item in playlist["items"]:
-                                safe_item = {
-                                    "trackName": item.get("track", {}).get("trackName", ""),
-                                    "artistName": item.get("track", {}).get("artistName", ""),
-                                    "albumName": item.get("track", {}).get("albumName", ""),
-                                    "addedAt": item.get("addedAt", "")
-                                }
-                                safe_playlist["items"].append(safe_item)
-                        
-                        safe_playlists.append(safe_playlist)
-                
+                if ijson is not None:
+                    # Stream playlist by playlist from under the
+                    # "playlists" key
+                    with open(file_path, 'rb') as f:
+                        for playlist in ijson.items(f, 'playlists.item', use_float=True):
+                            safe_playlists.append(safe_playlist(playlist))
+                else:
+                    data = load_json_file(file_path)
+                    if isinstance(data, dict) and "playlists" in data:
+                        for playlist in data["playlists"]:
+                            safe_playlists.append(safe_playlist(playlist))
+
             except Exception as e:
                 print(f"  Error processing playlist file {file_path}: {e}")
         
         # Save safe playlists
         output_path = self.output_dir / "safe_playlists.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump({"playlists": safe_playlists}, f, indent=2, ensure_ascii=False)
-        
+        write_json_file(output_path, {"playlists": safe_playlists}, compact=True)
+
         print(f"  Saved {len(safe_playlists)} safe playlists to: {output_path}")
 
     def sanitize_all_files(self):
@@ -273,19 +486,26 @@ class SpotifyDataSanitizer:
             "Spotify Extended Streaming History"
         ]
         
+        json_files = []
         for dir_name in spotify_dirs:
             dir_path = self.data_dir / dir_name
             if dir_path.exists():
                 print(f"\nProcessing directory: {dir_name}")
-                json_files = glob.glob(str(dir_path / "*.json"))
-                
-                for file_path in json_files:
-                    sanitized_data = self.sanitize_file(Path(file_path))
-                    if sanitized_data is not None:
-                        self.save_sanitized_file(Path(file_path), sanitized_data)
+                json_files.extend(scan_json_files(dir_path))
             else:
                 print(f"Directory not found: {dir_name}")
 
+        if len(json_files) > 1:
+            # Each file's load/sanitize/save is independent CPU-bound
+            # work, so fan the files out across worker processes and fold
+            # the stats back in deterministically
+            with ProcessPoolExecutor() as executor:
+                for result in executor.map(self._sanitize_one, json_files, chunksize=4):
+                    self._merge_result(*result)
+        else:
+            for file_path in json_files:
+                self._merge_result(*self._sanitize_one(file_path))
+
     def save_sanitization_report(self, output_file="sanitization_report.json"):
         """Save the sanitization report"""
         output_path = self.output_dir / output_file
@@ -296,10 +516,9 @@ class SpotifyDataSanitizer:
             "redaction_patterns": list(self.redaction_patterns.keys()),
             "removed_fields": self.remove_fields
         }
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-        
+
+        write_json_file(output_path, report)
+
         print(f"\nSanitization report saved to: {output_path}")
 
     def print_summary(self):
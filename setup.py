@@ -5,11 +5,17 @@ Setup script for Spotify Wrapped Dashboard
 This script helps you set up the project and process your Spotify data safely.
 """
 
+import io
 import os
 import sys
-import subprocess
+from contextlib import redirect_stdout
 from pathlib import Path
 
+# The processing scripts run in-process: spawning a fresh interpreter
+# per phase paid cold-start and re-import costs, and this way the two
+# phases share module caches (compiled regexes included)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+
 def print_banner():
     """Print the project banner"""
     print("🎵" + "="*60 + "🎵")
@@ -56,45 +62,49 @@ def run_privacy_check():
     print("\n🔒 Running privacy analysis...")
     
     try:
-        result = subprocess.run([
-            sys.executable, "scripts/privacy_filter.py"
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("✅ Privacy analysis completed")
-            print("   Check privacy_analysis_report.json for details")
-            return True
-        else:
-            print("❌ Privacy analysis failed")
-            print(result.stderr)
-            return False
-            
-    except FileNotFoundError:
+        from privacy_filter import SpotifyPrivacyFilter
+    except ImportError:
         print("❌ Could not find privacy_filter.py script")
         return False
 
+    try:
+        # The script's own console output stays suppressed, matching the
+        # old captured subprocess behaviour
+        with redirect_stdout(io.StringIO()):
+            SpotifyPrivacyFilter(".").run()
+
+        print("✅ Privacy analysis completed")
+        print("   Check privacy_analysis_report.json for details")
+        return True
+
+    except Exception as e:
+        print("❌ Privacy analysis failed")
+        print(e)
+        return False
+
 def run_data_sanitization():
     """Run the data sanitization script"""
     print("\n🧹 Creating sanitized data...")
     
     try:
-        result = subprocess.run([
-            sys.executable, "scripts/sanitize_data.py", "--output-dir", "safe_data"
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("✅ Data sanitization completed")
-            print("   Safe data saved to: safe_data/")
-            return True
-        else:
-            print("❌ Data sanitization failed")
-            print(result.stderr)
-            return False
-            
-    except FileNotFoundError:
+        from sanitize_data import SpotifyDataSanitizer
+    except ImportError:
         print("❌ Could not find sanitize_data.py script")
         return False
 
+    try:
+        with redirect_stdout(io.StringIO()):
+            SpotifyDataSanitizer(".", "safe_data").run()
+
+        print("✅ Data sanitization completed")
+        print("   Safe data saved to: safe_data/")
+        return True
+
+    except Exception as e:
+        print("❌ Data sanitization failed")
+        print(e)
+        return False
+
 def create_sample_data():
     """Create sample data for testing if no real data is available"""
     print("\n📝 Creating sample data for testing...")